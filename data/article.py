@@ -48,6 +48,9 @@ class ArticleData:
     def __setitem__(self, lang: Language, article_data_lang: ArticleDataLang):
         self.__languages[lang] = article_data_lang
 
+    def __contains__(self, lang: Language):
+        return lang in self.__languages
+
     def clear(self): self.__init__()
 
     def get_languages(self):
@@ -0,0 +1,202 @@
+"""Компактный двоичный формат ArticleData.
+
+Позволяет сохранить результат извлечения и затем формировать из него XML, docx и другие форматы
+без повторного разбора исходных документов.
+
+    СТРУКТУРА файла:
+    _________________________________________________
+    Байты    |   Содержание
+    _________________________________________________
+    0-3      |   MAGIC
+    4        |   VERSION
+    5-...    |   тело, сжатое zlib
+    _________|_______________________________________
+
+Тело - последовательность полей в порядке записи в функции encode. Числа записываются в формате
+varint, строки - длиной в байтах и UTF-8, перечисления - именем элемента. Места работы хранятся
+одной таблицей, авторы ссылаются на них индексами.
+
+Поврежденный или обрезанный файл decode сообщает исключением ValueError.
+"""
+
+import zlib
+
+from data.article import ArticleData, ArticleDataLang
+from data.author import Author
+from data.enum_const import Language, AuthorRole, ArticleType, Code
+from data.workplace import Workplace
+
+MAGIC = b'ADAT'
+VERSION = 1
+EXTENSION = '.adat'
+
+
+class _Writer:
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def uint(self, value: int):
+        while value >= 0x80:
+            self._buffer.append(value & 0x7F | 0x80)
+            value >>= 7
+        self._buffer.append(value)
+
+    def string(self, value: str | None):
+        encoded = (value or '').encode('utf-8')
+        self.uint(len(encoded))
+        self._buffer += encoded
+
+    def strings(self, values: list[str]):
+        self.uint(len(values))
+        for value in values:
+            self.string(value)
+
+    def getvalue(self) -> bytes:
+        return bytes(self._buffer)
+
+
+class _Reader:
+
+    def __init__(self, payload: bytes):
+        self._payload = memoryview(payload)
+        self._offset = 0
+
+    def uint(self) -> int:
+        value = shift = 0
+        while True:
+            byte = self._payload[self._offset]  # IndexError, если файл обрезан
+            self._offset += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+    def string(self) -> str:
+        length = self.uint()
+        start, self._offset = self._offset, self._offset + length
+        if self._offset > len(self._payload):
+            raise IndexError("Строка выходит за конец данных")
+        return str(self._payload[start:self._offset], 'utf-8')
+
+    def strings(self) -> list[str]:
+        return [self.string() for _ in range(self.uint())]
+
+
+def encode(data: ArticleData) -> bytes:
+    writer = _Writer()
+
+    writer.string(data.received_date)
+    writer.string(data.accepted_date)
+    writer.string(data.pages)
+    writer.string(data.article_type.name)
+    writer.strings(data.rubrics)
+
+    writer.uint(len(data.codes))
+    for code, values in data.codes.items():
+        writer.string(code.name)
+        writer.strings(values or [])
+
+    languages = [lang for lang in Language if lang in data]
+    writer.uint(len(languages))
+    for lang in languages:
+        writer.string(lang.name)
+        writer.string(data[lang].title)
+        writer.string(data[lang].abstract)
+        writer.strings(data[lang].keywords)
+        writer.string(data[lang].text)
+        writer.string(data[lang].funding)
+
+    # Одно место работы обычно указано у нескольких авторов, поэтому записываем его один раз
+    workplaces: dict[tuple[str, str, str], int] = {}
+    for author in data.authors:
+        for lang in Language:
+            if lang in author:
+                for workplace in author[lang].workplaces:
+                    workplaces.setdefault(_workplace_key(workplace), len(workplaces))
+
+    writer.uint(len(workplaces))
+    for name, town, country in workplaces:
+        writer.string(name)
+        writer.string(town)
+        writer.string(country)
+
+    writer.uint(len(data.authors))
+    for author in data.authors:
+        writer.string(author.role.name)
+        languages = [lang for lang in Language if lang in author]
+        writer.uint(len(languages))
+        for lang in languages:
+            writer.string(lang.name)
+            writer.string(author[lang].surname)
+            writer.string(author[lang].initials)
+            writer.uint(len(author[lang].workplaces))
+            for workplace in author[lang].workplaces:
+                writer.uint(workplaces[_workplace_key(workplace)])
+            writer.string(author[lang].review if author.role is AuthorRole.Reviewer else '')
+
+    return MAGIC + bytes([VERSION]) + zlib.compress(writer.getvalue(), 1)
+
+
+def decode(payload: bytes, data_holder: ArticleData) -> ArticleData:
+    if len(payload) <= len(MAGIC) or payload[:len(MAGIC)] != MAGIC:
+        raise ValueError("Файл не является сохраненными данными статьи")
+
+    version = payload[len(MAGIC)]
+    if version != VERSION:
+        raise ValueError(f"Неподдерживаемая версия формата данных статьи: {version}")
+
+    try:
+        return _decode_body(_Reader(zlib.decompress(payload[len(MAGIC) + 1:])), data_holder)
+    except (zlib.error, IndexError, KeyError, UnicodeDecodeError) as error:
+        raise ValueError(f"Данные статьи повреждены: {type(error).__name__}: {error}") from error
+
+
+def _decode_body(reader: _Reader, data_holder: ArticleData) -> ArticleData:
+    data_holder.received_date = reader.string()
+    data_holder.accepted_date = reader.string()
+    data_holder.pages = reader.string()
+    data_holder.article_type = ArticleType[reader.string()]
+    data_holder.rubrics = reader.strings()
+
+    for _ in range(reader.uint()):
+        code = Code[reader.string()]
+        data_holder.codes[code] = reader.strings()
+
+    for _ in range(reader.uint()):
+        lang = Language[reader.string()]
+        data_holder[lang] = ArticleDataLang(
+            title=reader.string(),
+            abstract=reader.string(),
+            keywords=reader.strings(),
+            text=reader.string(),
+            funding=reader.string()
+        )
+
+    workplaces = [
+        Workplace(name=reader.string(), town=reader.string(), country=reader.string())
+        for _ in range(reader.uint())
+    ]
+
+    data_holder.authors = []
+    for _ in range(reader.uint()):
+        author = Author()
+        author.role = AuthorRole[reader.string()]
+
+        for _ in range(reader.uint()):
+            author_lang = author[Language[reader.string()]]
+            author_lang.surname = reader.string()
+            author_lang.initials = reader.string()
+            author_lang.workplaces = [workplaces[reader.uint()] for _ in range(reader.uint())]
+
+            review = reader.string()
+            if author.role is AuthorRole.Reviewer:
+                author_lang.review = review
+
+        data_holder.authors.append(author)
+
+    return data_holder
+
+
+def _workplace_key(workplace: Workplace) -> tuple[str, str, str]:
+    return workplace.name, workplace.town, workplace.country
@@ -47,6 +47,9 @@ class Author:
     def __setitem__(self, lang: Language, author_lang: AuthorLang):
         self.__languages[lang] = author_lang
 
+    def __contains__(self, lang: Language):
+        return lang in self.__languages
+
     @property
     def role(self):
         return self._role
@@ -0,0 +1,68 @@
+"""Задание пакетной обработки и его источники"""
+
+import io
+import zipfile
+
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class ArchiveMember:
+    """Файл внутри zip-архива. Передается в рабочий процесс вместо пути и читается там в память
+
+    Attributes:
+        archive (str): Путь к архиву
+        name (str): Имя файла внутри архива в том виде, в котором его прочитал zipfile. Нужно только для чтения
+        size (int): Размер файла после распаковки в байтах
+        display_name (str): Имя файла в правильной кодировке (см. decode_member_name). Из него берутся
+            имя рецензента, имя результата и имя в отчетах. По умолчанию совпадает с name
+    """
+    archive: str
+    name: str
+    size: int = 0
+    display_name: str = ''
+
+    def __post_init__(self):
+        if not self.display_name:
+            object.__setattr__(self, 'display_name', self.name)
+
+    def open(self) -> io.BytesIO:
+        with zipfile.ZipFile(self.archive) as archive:
+            stream = io.BytesIO(archive.read(self.name))
+
+        stream.name = self.display_name
+        return stream
+
+    def __str__(self):
+        return f"{self.archive}:{self.display_name}"
+
+
+def decode_member_name(info: zipfile.ZipInfo) -> str:
+    """ Имя файла архива в правильной кодировке.
+
+    Без флага UTF-8 (бит 0x800) zipfile читает имена как cp437, а архиваторы пишут их в кодировке системы:
+    Info-ZIP без UTF-8 локали - в UTF-8, Проводник Windows - в cp866. Поэтому такие имена
+    перекодируются обратно в байты и декодируются как UTF-8, а если не получилось - как cp866.
+    """
+    if info.flag_bits & 0x800:
+        return info.filename
+
+    raw = info.filename.encode('cp437')
+    try:
+        return raw.decode('utf-8')
+    except UnicodeDecodeError:
+        return raw.decode('cp866')
+
+
+@dataclass
+class ArticleJob:
+    """Задание на обработку одной статьи
+
+    Attributes:
+        article (str | ArchiveMember): Путь к файлу статьи или файл статьи в архиве выпуска
+        reviews (list(str | ArchiveMember)): Файлы рецензий
+        saving_path (str): Путь сохранения результата без расширения
+    """
+    article: str | ArchiveMember
+    reviews: list[str | ArchiveMember] = field(default_factory=list)
+    saving_path: str = ''
@@ -0,0 +1,211 @@
+"""Пакетная обработка статей выпуска"""
+
+import os
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable
+
+from data.article import ArticleData
+from data.batch.article_job import ArticleJob, ArchiveMember
+from data.batch.isolated_worker import IsolatedWorker, WorkerLimits, WorkerError, FileError, ErrorKind, check_source
+from data.catalog.article_catalog import ArticleCatalog
+from data.extractor.data_extractor import DataExtractor
+from data.extractor.extraction_strategy import (
+    DataExtractionStrategy, ReviewExtractionStrategy, BinaryExtractionStrategy
+)
+from data.extractor.profile_extraction_strategy import ProfileExtractionStrategy
+from data.memory_profiler import MemoryUsage
+from data.name_normaliser import NameNormaliser
+from data.saver.data_saver import DataSaver
+from data.saver.saving_strategy import (
+    DataSavingStrategy, XMLSavingStrategy, DocxSavingStrategy, BinarySavingStrategy
+)
+
+
+@dataclass
+class JobResult:
+    """Результат обработки одной статьи
+
+    Attributes:
+        job (ArticleJob): Задание
+        data (ArticleData | None): Извлеченные данные. None, если статью извлечь не удалось
+        errors (list(FileError)): Ошибки обработки файлов задания
+        memory (dict(str, MemoryUsage)): Замеры памяти по файлам задания, если они включены
+    """
+    job: ArticleJob
+    data: ArticleData | None = None
+    errors: list[FileError] = field(default_factory=list)
+    memory: dict[str, MemoryUsage] = field(default_factory=dict)
+
+    @property
+    def succeeded(self) -> bool:
+        return not self.errors
+
+
+@dataclass
+class BatchReport:
+    results: list[JobResult] = field(default_factory=list)
+
+    @property
+    def errors(self) -> list[FileError]:
+        return [error for result in self.results for error in result.errors]
+
+    @property
+    def failed(self) -> list[JobResult]:
+        return [result for result in self.results if not result.succeeded]
+
+    def to_dict(self) -> dict:
+        return {
+            'total': len(self.results),
+            'failed': len(self.failed),
+            'errors': [error.to_dict() for error in self.errors],
+            'memory': {
+                source: usage.to_dict()
+                for result in self.results
+                for source, usage in result.memory.items()
+            },
+        }
+
+
+class BatchProcessor:
+    """Параллельно обрабатывает задания, извлекая каждый файл в изолированном процессе.
+
+    Перед разбором файл проходит быструю проверку check_source: поврежденные файлы и файлы чужого шаблона
+    сразу попадают в отчет. Файлы на диске проверяются до запуска рабочего процесса, файлы архива -
+    в рабочем процессе, после единственного чтения в память.
+    Сначала параллельно извлекаются все задания, затем имена всего пакета заполняются на втором языке,
+    затем результаты параллельно сохраняются.
+    Ошибка в файле рецензии не отменяет сохранение статьи, ошибка в файле статьи отменяет только ее задание.
+    Все ошибки собираются в BatchReport, остальные задания выпуска продолжают обрабатываться.
+    Если задан каталог, извлеченные статьи после сохранения добавляются в него транзакциями
+    по catalog_batch_size статей из потока, вызвавшего process.
+    """
+
+    def __init__(self, limits: WorkerLimits = None, max_workers: int = None,
+                 saving_strategies: tuple[type[DataSavingStrategy], ...] = (
+                     XMLSavingStrategy, DocxSavingStrategy, BinarySavingStrategy
+                 ),
+                 catalog: ArticleCatalog = None, catalog_batch_size: int = 200):
+        self._worker = IsolatedWorker(limits)
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._saving_strategies = saving_strategies
+        self._catalog = catalog
+        self._catalog_batch_size = catalog_batch_size
+        self._name_normaliser = NameNormaliser()
+        self._progress_lock = threading.Lock()
+
+    def process(self, jobs: list[ArticleJob], progress_callback: Callable[[float], None] = None,
+                job_callback: Callable[[JobResult], None] = None) -> BatchReport:
+        """ progress_callback вызывается из рабочих потоков после каждого файла и каждого сохранения,
+        job_callback - после сохранения каждого задания """
+        progress_elements = sum(1 + len(job.reviews) + len(self._saving_strategies) for job in jobs)
+
+        def step():
+            if progress_callback is not None:
+                with self._progress_lock:
+                    progress_callback(100 / progress_elements)
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            results = list(executor.map(lambda job: self._extract_job(job, step), jobs))
+
+            # Имена транслитерируются одним проходом по всему пакету: повторяющиеся в выпуске строки
+            # обрабатываются по одному разу
+            self._name_normaliser.normalise([result.data for result in results if result.data is not None])
+
+            list(executor.map(lambda result: self._save_job(result, step, job_callback), results))
+
+        self._add_to_catalog(results)
+        return BatchReport(results)
+
+    def render(self, jobs: list[ArticleJob], progress_callback: Callable[[float], None] = None) -> BatchReport:
+        """ Формирует выходные файлы из данных, сохраненных BinarySavingStrategy. В ArticleJob.article - путь к ним.
+        В каталог статьи не добавляются: они уже занесены туда под путем исходного документа при process """
+        data_extractor = DataExtractor()
+        data_extractor.set_strategy(BinaryExtractionStrategy())
+        report = BatchReport()
+
+        for job in jobs:
+            result = JobResult(job, ArticleData())
+            try:
+                data_extractor.extract_data(job.article, result.data)
+            except (OSError, ValueError) as error:
+                result.data = None
+                result.errors.append(FileError(str(job.article), ErrorKind.EXCEPTION, f"{type(error).__name__}: {error}"))
+
+            self._save(result)
+            report.results.append(result)
+
+            if progress_callback is not None:
+                progress_callback(100 / len(jobs))
+
+        return report
+
+    def _extract_job(self, job: ArticleJob, step: Callable[[], None]) -> JobResult:
+        result = JobResult(job)
+
+        try:
+            result.data, memory = self._extract(ProfileExtractionStrategy, job.article)
+            if memory is not None:
+                result.memory[str(job.article)] = memory
+        except WorkerError as error:
+            result.errors.append(error.error)
+        finally:
+            step()
+
+        for review in job.reviews:
+            if result.data is None:
+                step()
+                continue
+
+            try:
+                review_data, memory = self._extract(ReviewExtractionStrategy, review)
+                result.data.authors.extend(review_data.authors)
+                if memory is not None:
+                    result.memory[str(review)] = memory
+            except WorkerError as error:
+                result.errors.append(error.error)
+            finally:
+                step()
+
+        return result
+
+    def _save_job(self, result: JobResult, step: Callable[[], None],
+                  job_callback: Callable[[JobResult], None] = None) -> JobResult:
+        self._save(result, step)
+
+        if job_callback is not None:
+            job_callback(result)
+
+        return result
+
+    def _extract(self, strategy_type: type[DataExtractionStrategy],
+                 source: str | ArchiveMember) -> tuple[ArticleData, MemoryUsage | None]:
+        if isinstance(source, ArchiveMember):
+            return self._worker.run(strategy_type(), source, preflight=True)
+
+        # Стратегия получает шаблон, найденный проверкой, и в рабочем процессе его заново не ищет
+        return self._worker.run(check_source(strategy_type, source, str(source)), source)
+
+    def _save(self, result: JobResult, step: Callable[[], None] = lambda: None):
+        data_saver = DataSaver()
+
+        for strategy in self._saving_strategies:
+            if result.data is not None:
+                try:
+                    data_saver.set_strategy(strategy())
+                    data_saver.save_data(result.job.saving_path, result.data)
+                except Exception as error:  # pylint: disable=broad-exception-caught
+                    result.errors.append(
+                        FileError(result.job.saving_path, ErrorKind.SAVING, f"{type(error).__name__}: {error}")
+                    )
+            step()
+
+    def _add_to_catalog(self, results: list[JobResult]):
+        if self._catalog is None:
+            return
+
+        articles = [(str(result.job.article), result.data) for result in results if result.data is not None]
+        for start in range(0, len(articles), self._catalog_batch_size):
+            self._catalog.add(articles[start:start + self._catalog_batch_size])
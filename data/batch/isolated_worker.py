@@ -0,0 +1,287 @@
+"""Изолированное извлечение данных из одного файла в отдельном процессе"""
+
+import multiprocessing
+import os
+import sys
+import traceback
+
+from dataclasses import dataclass
+from enum import Enum
+from multiprocessing.connection import Connection
+
+from data.article import ArticleData
+from data.batch.article_job import ArchiveMember
+from data.batch.memory_budget import MemoryBudget
+from data.extractor.data_extractor import DataExtractor
+from data.extractor.extraction_strategy import DataExtractionStrategy, DocumentSource
+from data.extractor.preflight import check_docx, PreflightError
+from data.memory_profiler import MemoryUsage, profiler
+
+try:
+    import resource
+except ImportError:  # Windows: ограничение памяти процесса недоступно
+    resource = None
+
+
+class ErrorKind(Enum):
+    EXCEPTION = 'exception'
+    TIMEOUT = 'timeout'
+    MEMORY = 'memory'
+    CRASH = 'crash'
+    SAVING = 'saving'
+    PREFLIGHT = 'preflight'
+    TEMPLATE = 'template'
+
+
+@dataclass
+class WorkerLimits:
+    """Ограничения для обработки одного файла
+
+    Attributes:
+        timeout (float): Максимальное время обработки файла в секундах
+        memory_limit (int | None): Максимальный объем адресного пространства процесса в байтах.
+            None - без ограничения. На Windows не применяется
+        retries (int): Количество повторных попыток после неудачи
+        retry_on (frozenset(ErrorKind)): Виды ошибок, после которых имеет смысл повторять попытку.
+            Исключение при разборе воспроизводится на том же файле, поэтому по умолчанию не повторяется
+        trace_memory (bool): Замерять пики памяти по этапам с помощью tracemalloc для отчета. Замедляет разбор
+        memory_budget (int | None): Суммарный объем памяти в байтах, на который рассчитаны одновременно
+            обрабатываемые файлы. None - число одновременных файлов ограничено только числом потоков.
+            Оценка уточняется по пиковому RSS рабочих процессов, поэтому trace_memory для нее не нужен
+    """
+    timeout: float = 120.0
+    memory_limit: int | None = 2 * 1024 ** 3
+    retries: int = 1
+    retry_on: frozenset[ErrorKind] = frozenset({ErrorKind.TIMEOUT, ErrorKind.MEMORY, ErrorKind.CRASH})
+    trace_memory: bool = False
+    memory_budget: int | None = None
+
+
+@dataclass
+class FileError:
+    """Ошибка обработки одного файла
+
+    Attributes:
+        source (str): Путь к файлу или файл в архиве
+        kind (ErrorKind): Вид ошибки
+        message (str): Краткое описание ошибки
+        details (str): Трассировка исключения из рабочего процесса, если она есть
+        attempts (int): Количество сделанных попыток
+    """
+    source: str
+    kind: ErrorKind
+    message: str
+    details: str = ''
+    attempts: int = 1
+
+    def to_dict(self) -> dict:
+        return {
+            'source': self.source,
+            'kind': self.kind.value,
+            'message': self.message,
+            'details': self.details,
+            'attempts': self.attempts,
+        }
+
+
+class WorkerError(Exception):
+
+    def __init__(self, error: FileError):
+        super().__init__(f"{error.source}: {error.message}")
+        self.error = error
+
+
+@dataclass
+class _Attempt:
+    data: ArticleData | None = None
+    memory: MemoryUsage | None = None
+    rss_growth: int | None = None
+    error: FileError | None = None
+
+
+def check_source(strategy_type: type[DataExtractionStrategy], source: DocumentSource,
+                 source_name: str) -> DataExtractionStrategy:
+    """ Быстрая проверка файла до полного разбора. Возвращает стратегию, настроенную на найденный шаблон.
+    Бросает WorkerError с видом PREFLIGHT или TEMPLATE, если файл разбирать не нужно """
+    try:
+        preflight = check_docx(source, strategy_type.template_markers)
+    except (PreflightError, OSError) as error:
+        raise WorkerError(FileError(source_name, ErrorKind.PREFLIGHT, str(error))) from error
+
+    strategy = strategy_type.for_template(preflight.missing_markers)
+    if strategy is None:
+        missing = ', '.join(preflight.missing_markers)
+        raise WorkerError(FileError(
+            source_name, ErrorKind.TEMPLATE, f"Документ не соответствует шаблону, не найдено: {missing}"
+        ))
+
+    return strategy
+
+
+def _get_max_rss() -> int | None:
+    """ Пиковый RSS текущего процесса в байтах. None, если resource недоступен """
+    if resource is None:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux сообщает килобайты, macOS - байты
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+def _extract_in_child(connection: Connection, strategy: DataExtractionStrategy,
+                      source: DocumentSource | ArchiveMember, preflight: bool,
+                      memory_limit: int | None, trace_memory: bool):
+    """ Точка входа рабочего процесса. Результат или описание ошибки передаются через connection """
+    try:
+        # В отличие от tracemalloc, RSS учитывает и память libxml2/lxml
+        baseline_rss = _get_max_rss()
+
+        if memory_limit and resource is not None:
+            resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+
+        if trace_memory:
+            profiler.start()
+
+        if isinstance(source, ArchiveMember):
+            # Файл из архива читается прямо в память рабочего процесса, без распаковки на диск
+            source = source.open()
+
+        if preflight:
+            strategy = check_source(type(strategy), source, DataExtractionStrategy.get_source_name(source))
+
+        data_holder = ArticleData()
+        data_extractor = DataExtractor()
+        data_extractor.set_strategy(strategy)
+        data_extractor.extract_data(source, data_holder)
+        memory = profiler.stop()
+        rss_growth = _get_max_rss() - baseline_rss if baseline_rss is not None else None
+        connection.send(('ok', data_holder, memory, rss_growth))
+    except WorkerError as error:
+        connection.send(('error', error.error.kind, error.error.message, error.error.details))
+    except MemoryError:
+        connection.send(('error', ErrorKind.MEMORY, "Превышен лимит памяти", traceback.format_exc()))
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        connection.send(('error', ErrorKind.EXCEPTION, f"{type(error).__name__}: {error}", traceback.format_exc()))
+    finally:
+        connection.close()
+
+
+def _get_context():
+    # forkserver безопасен в многопоточном родителе и быстрее spawn, но есть только на Unix
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('forkserver')
+        context.set_forkserver_preload(['data.batch.isolated_worker'])
+        return context
+
+    return multiprocessing.get_context('spawn')
+
+
+class IsolatedWorker:
+    """Извлекает данные из файла в отдельном процессе с ограничением времени, памяти и числа попыток.
+
+    Падение, зависание или исключение при разборе одного файла не затрагивают вызывающий процесс.
+    Метод run потокобезопасен: для параллельной обработки его вызывают из нескольких потоков.
+    """
+
+    _context = None
+
+    def __init__(self, limits: WorkerLimits = None):
+        self.limits = limits or WorkerLimits()
+
+        self._budget = MemoryBudget(self.limits.memory_budget) if self.limits.memory_budget else None
+
+        if IsolatedWorker._context is None:
+            IsolatedWorker._context = _get_context()
+
+    def run(self, strategy: DataExtractionStrategy, source: DocumentSource | ArchiveMember,
+            preflight: bool = False) -> tuple[ArticleData, MemoryUsage | None]:
+        """ Возвращает извлеченные данные и замер памяти, если он включен в WorkerLimits.trace_memory.
+        preflight - проверить файл check_source в рабочем процессе перед разбором и извлекать стратегией,
+        которую она вернет для типа strategy. Нужен для файлов архива: они читаются в память только там,
+        и проверка в вызывающем процессе прочитала бы их второй раз """
+        attempts = 0
+
+        while True:
+            attempts += 1
+
+            if self._budget is None:
+                attempt = self.__run_once(strategy, source, preflight)
+            else:
+                attempt = self.__run_within_budget(strategy, source, preflight)
+
+            if attempt.error is None:
+                return attempt.data, attempt.memory
+
+            attempt.error.attempts = attempts
+            if attempt.error.kind not in self.limits.retry_on or attempts > self.limits.retries:
+                raise WorkerError(attempt.error)
+
+    def __run_within_budget(self, strategy: DataExtractionStrategy,
+                            source: DocumentSource | ArchiveMember, preflight: bool) -> _Attempt:
+        file_size = _get_file_size(source)
+        amount = self._budget.estimate(file_size)
+
+        self._budget.acquire(amount)
+        try:
+            attempt = self.__run_once(strategy, source, preflight)
+        finally:
+            self._budget.release(amount)
+
+        if attempt.rss_growth is not None:
+            self._budget.observe(file_size, attempt.rss_growth)
+
+        return attempt
+
+    def __run_once(self, strategy: DataExtractionStrategy,
+                   source: DocumentSource | ArchiveMember, preflight: bool) -> _Attempt:
+        receiver, sender = self._context.Pipe(duplex=False)
+        process = self._context.Process(
+            target=_extract_in_child,
+            args=(sender, strategy, source, preflight, self.limits.memory_limit, self.limits.trace_memory),
+            daemon=True
+        )
+        process.start()
+        sender.close()
+
+        try:
+            if not receiver.poll(self.limits.timeout):
+                process.kill()
+                process.join()
+                return _Attempt(error=FileError(
+                    str(source), ErrorKind.TIMEOUT, f"Превышено время обработки ({self.limits.timeout} с)"
+                ))
+
+            try:
+                message = receiver.recv()
+            except EOFError:
+                # Процесс завершился, ничего не отправив: segfault, SIGKILL от ОС и т.п.
+                message = None
+        finally:
+            receiver.close()
+
+        process.join()
+
+        if message is None:
+            return _Attempt(error=FileError(
+                str(source), ErrorKind.CRASH, f"Рабочий процесс завершился с кодом {process.exitcode}"
+            ))
+
+        if message[0] == 'ok':
+            _, data, memory, rss_growth = message
+            return _Attempt(data=data, memory=memory, rss_growth=rss_growth)
+
+        _, kind, text, details = message
+        return _Attempt(error=FileError(str(source), kind, text, details))
+
+
+def _get_file_size(source: DocumentSource | ArchiveMember) -> int:
+    if isinstance(source, ArchiveMember):
+        return source.size
+
+    if isinstance(source, bytes):
+        return len(source)
+
+    try:
+        return os.path.getsize(source)
+    except (OSError, TypeError):
+        return 0
@@ -0,0 +1,72 @@
+"""Чтение выпуска из zip-архива без распаковки на диск"""
+
+import os
+import posixpath
+import zipfile
+
+from pathlib import PurePosixPath
+
+from data.batch.article_job import ArchiveMember, ArticleJob, decode_member_name
+
+REVIEW_PREFIX = 'referee_report'
+
+
+def read_issue_archive(archive_path: str, saving_dir: str) -> list[ArticleJob]:
+    """Составляет задания по архиву выпуска.
+
+    Каждая статья лежит в своей папке архива вместе с рецензиями (файлы referee_report_*.docx).
+    Если статья в архиве одна, папки не обязательны. Результат сохраняется в saving_dir
+    под именем статьи с суффиксом _EL, перед которым через '_' стоят папки статьи в архиве:
+    a1/manuscript.docx -> a1_manuscript_EL. Если имена все же совпали, бросается ValueError.
+    """
+    articles: dict[str, list[ArchiveMember]] = {}
+    reviews: dict[str, list[ArchiveMember]] = {}
+
+    with zipfile.ZipFile(archive_path) as archive:
+        for info in archive.infolist():
+            display_name = decode_member_name(info)
+            path = PurePosixPath(display_name)
+            if (info.is_dir() or path.suffix.lower() != '.docx' or path.name.startswith('~$')
+                    or path.parts[0] == '__MACOSX'):
+                continue
+
+            member = ArchiveMember(archive_path, info.filename, info.file_size, display_name)
+            group = reviews if path.name.lower().startswith(REVIEW_PREFIX) else articles
+            group.setdefault(posixpath.dirname(display_name), []).append(member)
+
+    if sum(len(members) for members in articles.values()) == 1:
+        # Статья в архиве одна: все рецензии архива относятся к ней, где бы они ни лежали
+        reviews = {directory: sum(reviews.values(), []) for directory in articles}
+
+    for directory in reviews:
+        if directory not in articles:
+            raise ValueError(f"Рецензии в папке архива '{directory}' не относятся ни к одной статье")
+
+    jobs = []
+    saving_paths: dict[str, ArchiveMember] = {}
+    for directory, members in sorted(articles.items()):
+        if len(members) > 1 and reviews.get(directory):
+            raise ValueError(f"В папке архива '{directory}' несколько статей, рецензии нельзя сопоставить")
+
+        for member in members:
+            saving_path = os.path.join(saving_dir, _get_saving_name(member.display_name))
+            if saving_path in saving_paths:
+                raise ValueError(
+                    f"Статьи '{saving_paths[saving_path].display_name}' и '{member.display_name}' "
+                    f"сохраняются в один файл {saving_path}"
+                )
+            saving_paths[saving_path] = member
+
+            jobs.append(ArticleJob(
+                article=member,
+                reviews=reviews.get(directory, []) if len(members) == 1 else [],
+                saving_path=saving_path
+            ))
+
+    return jobs
+
+
+def _get_saving_name(name: str) -> str:
+    """ В папках статей файлы часто называются одинаково, поэтому папки входят в имя результата """
+    path = PurePosixPath(name)
+    return '_'.join((*path.parent.parts, path.stem)) + '_EL'
@@ -0,0 +1,47 @@
+"""Бюджет памяти для пакетной обработки"""
+
+import threading
+
+
+class MemoryBudget:
+    """Ограничивает суммарную оценку памяти одновременно обрабатываемых файлов.
+
+    Оценка файла - накладные расходы процесса плюс размер файла, умноженный на коэффициент расширения.
+    Коэффициент уточняется по фактическому приросту пикового RSS рабочих процессов: tracemalloc не видит
+    память libxml2/lxml и занижает оценку. Файл, оценка которого больше всего бюджета, обрабатывается,
+    когда других файлов в работе нет.
+    """
+
+    PROCESS_OVERHEAD = 64 * 1024 ** 2
+    DEFAULT_EXPANSION = 20.0
+
+    def __init__(self, budget: int):
+        self._budget = budget
+        self._used = 0
+        self._expansion = self.DEFAULT_EXPANSION
+        self._observed = False
+        self._condition = threading.Condition()
+
+    def estimate(self, file_size: int) -> int:
+        return self.PROCESS_OVERHEAD + int(file_size * self._expansion)
+
+    def acquire(self, amount: int):
+        with self._condition:
+            self._condition.wait_for(lambda: self._used == 0 or self._used + amount <= self._budget)
+            self._used += amount
+
+    def release(self, amount: int):
+        with self._condition:
+            self._used -= amount
+            self._condition.notify_all()
+
+    def observe(self, file_size: int, rss_growth: int):
+        """ rss_growth - прирост пикового RSS рабочего процесса за обработку файла в байтах """
+        if file_size <= 0:
+            return
+
+        with self._condition:
+            expansion = rss_growth / file_size
+            # Первый замер заменяет значение по умолчанию, дальше держим наихудший коэффициент
+            self._expansion = max(self._expansion, expansion) if self._observed else expansion
+            self._observed = True
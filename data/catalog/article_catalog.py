@@ -0,0 +1,286 @@
+"""Каталог извлеченных статей в локальной базе SQLite"""
+
+import re
+import sqlite3
+
+from dataclasses import dataclass
+from typing import Iterable
+
+from unidecode import unidecode
+
+from data.article import ArticleData
+from data.author import Author
+from data.enum_const import Language, AuthorRole, Code
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS articles (
+        id INTEGER PRIMARY KEY,
+        source TEXT NOT NULL UNIQUE,
+        title TEXT NOT NULL,
+        pages TEXT NOT NULL,
+        received_date TEXT NOT NULL,
+        accepted_date TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS codes (
+        article_id INTEGER NOT NULL REFERENCES articles(id) ON DELETE CASCADE,
+        code TEXT NOT NULL,
+        value TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS codes_value ON codes(code, value);
+    CREATE INDEX IF NOT EXISTS codes_article ON codes(article_id);
+
+    CREATE TABLE IF NOT EXISTS persons (
+        article_id INTEGER NOT NULL REFERENCES articles(id) ON DELETE CASCADE,
+        num INTEGER NOT NULL,
+        lang TEXT NOT NULL,
+        name_key TEXT NOT NULL,
+        surname TEXT NOT NULL,
+        initials TEXT NOT NULL,
+        role TEXT NOT NULL,
+        review TEXT NOT NULL DEFAULT '',
+        PRIMARY KEY (article_id, num, lang)
+    );
+    CREATE INDEX IF NOT EXISTS persons_name ON persons(name_key, role);
+
+    CREATE TABLE IF NOT EXISTS workplaces (
+        article_id INTEGER NOT NULL,
+        num INTEGER NOT NULL,
+        lang TEXT NOT NULL,
+        name TEXT NOT NULL,
+        town TEXT NOT NULL,
+        country TEXT NOT NULL,
+        FOREIGN KEY (article_id, num, lang) REFERENCES persons(article_id, num, lang) ON DELETE CASCADE
+    );
+    CREATE INDEX IF NOT EXISTS workplaces_name ON workplaces(name COLLATE NOCASE);
+    CREATE INDEX IF NOT EXISTS workplaces_person ON workplaces(article_id, num, lang);
+"""
+
+# Версия схемы в PRAGMA user_version. Каталог - производные данные, поэтому каталог старой версии
+# создается заново: статьи нужно добавить в него повторно
+SCHEMA_VERSION = 2
+_TABLES = ('workplaces', 'persons', 'codes', 'articles')
+
+
+@dataclass
+class ReviewerConflict:
+    """Конфликт интересов рецензента
+
+    Attributes:
+        reviewer (str): Фамилия и инициалы рецензента
+        author (str): Фамилия и инициалы автора статьи, с которым связан рецензент
+        source (str): Статья каталога, в которой рецензент и автор - соавторы.
+            Пустая строка, если рецензент сам является автором проверяемой статьи
+    """
+    reviewer: str
+    author: str
+    source: str = ''
+
+
+def name_key(surname: str, initials: str) -> str:
+    """ Ключ для сравнения имен независимо от языка и оформления: 'Иванов И. И.' и 'Ivanov I.I.' -> 'ivanov ii' """
+    surname = unidecode(surname).lower().strip()
+    initials = ''.join(re.findall(r'\w+', unidecode(initials).lower()))
+    return f"{surname} {initials}".strip() if surname else ''
+
+
+def _person_names(author: Author) -> list[tuple[str, str]]:
+    names = []
+    for lang in Language:
+        if lang in author and author[lang].surname:
+            names.append((author[lang].surname, author[lang].initials))
+    return names
+
+
+class ArticleCatalog:
+    """Каталог статей. Соединение не потокобезопасно - используйте каталог из одного потока.
+
+    Статья определяется строкой source (обычно путь к файлу статьи). Повторное добавление
+    статьи с тем же source заменяет ее данные. Каждый автор статьи хранится под одним номером num,
+    по строке на каждый язык его имени.
+    """
+
+    def __init__(self, path: str):
+        self._connection = sqlite3.connect(path)
+        self._connection.execute('PRAGMA foreign_keys = ON')
+        self._connection.execute('PRAGMA journal_mode = WAL')
+
+        version, = self._connection.execute('PRAGMA user_version').fetchone()
+        if version != SCHEMA_VERSION:
+            with self._connection:
+                for table in _TABLES:
+                    self._connection.execute(f'DROP TABLE IF EXISTS {table}')
+            self._connection.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+        self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> "ArticleCatalog":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self):
+        self._connection.close()
+
+    def add(self, articles: Iterable[tuple[str, ArticleData]]):
+        """ Добавляет или обновляет статьи одной транзакцией """
+        with self._connection:
+            for source, data in articles:
+                self.__upsert(source, data)
+
+    def __upsert(self, source: str, data: ArticleData):
+        title = data[Language.ENG].title if Language.ENG in data else ''
+        self._connection.execute(
+            """
+                INSERT INTO articles (source, title, pages, received_date, accepted_date)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(source) DO UPDATE SET
+                    title = excluded.title,
+                    pages = excluded.pages,
+                    received_date = excluded.received_date,
+                    accepted_date = excluded.accepted_date
+            """,
+            (source, title, data.pages or '', data.received_date or '', data.accepted_date or '')
+        )
+        article_id = self._connection.execute('SELECT id FROM articles WHERE source = ?', (source,)).fetchone()[0]
+
+        # Дочерние записи удаляются каскадно вместе с persons, codes чистим явно
+        self._connection.execute('DELETE FROM codes WHERE article_id = ?', (article_id,))
+        self._connection.execute('DELETE FROM persons WHERE article_id = ?', (article_id,))
+
+        self._connection.executemany(
+            'INSERT INTO codes (article_id, code, value) VALUES (?, ?, ?)',
+            [
+                (article_id, code.name, value.strip())
+                for code, values in data.codes.items()
+                for value in values or []
+            ]
+        )
+
+        persons = []
+        workplaces = []
+        # Номер общий для всех языков автора: поиск по любому из его имен находит одного человека
+        for num, author in enumerate(data.authors, 1):
+            for lang in Language:
+                if lang not in author or not author[lang].surname:
+                    continue
+
+                surname, initials = author[lang].surname, author[lang].initials
+                persons.append((
+                    article_id, num, lang.name, name_key(surname, initials), surname, initials, author.role.name,
+                    (author[lang].review if author.role is AuthorRole.Reviewer else None) or ''
+                ))
+                workplaces.extend(
+                    (article_id, num, lang.name, workplace.name, workplace.town, workplace.country)
+                    for workplace in author[lang].workplaces
+                )
+
+        self._connection.executemany(
+            """
+                INSERT INTO persons (article_id, num, lang, name_key, surname, initials, role, review)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            persons
+        )
+        self._connection.executemany(
+            'INSERT INTO workplaces (article_id, num, lang, name, town, country) VALUES (?, ?, ?, ?, ?, ?)',
+            workplaces
+        )
+
+    def find_by_code(self, code: Code, value: str) -> list[str]:
+        rows = self._connection.execute(
+            """
+                SELECT DISTINCT articles.source FROM codes
+                JOIN articles ON articles.id = codes.article_id
+                WHERE codes.code = ? AND codes.value = ?
+            """,
+            (code.name, value.strip())
+        )
+        return [source for source, in rows]
+
+    def find_duplicate_dois(self, source: str, data: ArticleData) -> dict[str, list[str]]:
+        """ DOI статьи, которые уже есть в каталоге у других статей, и эти статьи """
+        duplicates = {}
+        for doi in data.codes.get(Code.DOI) or []:
+            sources = [other for other in self.find_by_code(Code.DOI, doi) if other != source]
+            if sources:
+                duplicates[doi.strip()] = sources
+        return duplicates
+
+    def find_by_person(self, surname: str, initials: str, role: AuthorRole = None) -> list[str]:
+        query = """
+            SELECT DISTINCT articles.source FROM persons
+            JOIN articles ON articles.id = persons.article_id
+            WHERE persons.name_key = ?
+        """
+        params = [name_key(surname, initials)]
+        if role is not None:
+            query += ' AND persons.role = ?'
+            params.append(role.name)
+
+        return [source for source, in self._connection.execute(query, params)]
+
+    def find_by_workplace(self, name: str) -> list[str]:
+        rows = self._connection.execute(
+            """
+                SELECT DISTINCT articles.source FROM workplaces
+                JOIN articles ON articles.id = workplaces.article_id
+                WHERE workplaces.name = ? COLLATE NOCASE
+            """,
+            (name.strip(),)
+        )
+        return [source for source, in rows]
+
+    def find_reviewer_conflicts(self, data: ArticleData) -> list[ReviewerConflict]:
+        """ Рецензенты статьи, которые сами являются ее авторами или были соавторами ее авторов в каталоге.
+        Каждый конфликт возвращается один раз, по какому бы из языков имен он ни нашелся """
+        # Ключ имени -> номер человека в статье. Человек называется по первому из его имен
+        authors: dict[str, int] = {}
+        reviewers: dict[str, int] = {}
+        names: list[str] = []
+
+        for author in data.authors:
+            person_names = _person_names(author)
+            if not person_names:
+                continue
+
+            target = reviewers if author.role is AuthorRole.Reviewer else authors
+            for surname, initials in person_names:
+                target.setdefault(name_key(surname, initials), len(names))
+            names.append(' '.join(person_names[0]).strip())
+
+        conflicts = [
+            ReviewerConflict(names[reviewer], names[author])
+            for reviewer, author in dict.fromkeys(
+                (reviewer, authors[key]) for key, reviewer in reviewers.items() if key in authors
+            )
+        ]
+
+        if not reviewers or not authors:
+            return conflicts
+
+        reviewer_marks = ','.join('?' * len(reviewers))
+        author_marks = ','.join('?' * len(authors))
+        rows = self._connection.execute(
+            f"""
+                SELECT reviewer.name_key, author.name_key, articles.source, author.num
+                FROM persons AS reviewer
+                JOIN persons AS author ON author.article_id = reviewer.article_id
+                JOIN articles ON articles.id = reviewer.article_id
+                WHERE reviewer.name_key IN ({reviewer_marks}) AND reviewer.role != ?
+                  AND author.name_key IN ({author_marks}) AND author.role != ?
+                  AND author.num != reviewer.num
+            """,
+            [*reviewers, AuthorRole.Reviewer.name, *authors, AuthorRole.Reviewer.name]
+        )
+
+        # Строки по каждому языку имен схлопываются: рецензент, статья каталога и автор в ней
+        found: dict[tuple[int, str, int], int] = {}
+        for reviewer_key, author_key, source, author_num in rows:
+            found.setdefault((reviewers[reviewer_key], source, author_num), authors[author_key])
+
+        conflicts.extend(
+            ReviewerConflict(names[reviewer], names[author], source)
+            for (reviewer, source, _), author in found.items()
+        )
+        return conflicts
@@ -1,5 +1,5 @@
 from data.article import ArticleData
-from data.extractor.extraction_strategy import DataExtractionStrategy
+from data.extractor.extraction_strategy import DataExtractionStrategy, DocumentSource
 
 
 class DataExtractor:
@@ -9,5 +9,5 @@ class DataExtractor:
     def set_strategy(self, data_extraction_strategy: DataExtractionStrategy):
         self.data_extraction_strategy = data_extraction_strategy
 
-    def extract_data(self, path: str, data_holder: ArticleData):
-        self.data_extraction_strategy.extract_data(path, data_holder)
\ No newline at end of file
+    def extract_data(self, source: DocumentSource, data_holder: ArticleData):
+        self.data_extraction_strategy.extract_data(source, data_holder)
\ No newline at end of file
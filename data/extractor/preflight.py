@@ -0,0 +1,139 @@
+"""Быстрая проверка .docx до полного разбора.
+
+Читается только центральный каталог zip и начало word/document.xml до конца первой таблицы,
+поэтому поврежденные, зашифрованные и чужие файлы отсеиваются за миллисекунды.
+"""
+
+import codecs
+import io
+import os
+import re
+import zipfile
+import zlib
+
+from dataclasses import dataclass, field
+from html import unescape
+
+from data.extractor.extraction_strategy import DocumentSource
+
+DOCUMENT_XML = 'word/document.xml'
+CONTENT_TYPES_XML = '[Content_Types].xml'
+
+# Зашифрованный паролем .docx, как и старый .doc, - это составной файл OLE, а не zip
+_OLE_SIGNATURE = b'\xD0\xCF\x11\xE0\xA1\xB1\x1A\xE1'
+_ZIP_SIGNATURE = b'PK\x03\x04'
+
+_CHUNK_SIZE = 64 * 1024
+_MAX_PREFIX_SIZE = 1024 * 1024
+
+_TABLE_TAG = re.compile(r'<w:tbl[ >]|</w:tbl>')
+_TEXT_TAG = re.compile(r'<w:t(?:\s[^>]*)?>([^<]*)</w:t>')
+
+
+class PreflightError(ValueError):
+    """Файл нельзя разобрать как .docx"""
+
+
+@dataclass
+class PreflightResult:
+    """Результат проверки файла, который можно разобрать как .docx
+
+    Attributes:
+        missing_markers (list(str)): Обязательные строки шаблона, не найденные в первой таблице документа
+    """
+    missing_markers: list[str] = field(default_factory=list)
+
+    @property
+    def template_ok(self) -> bool:
+        return not self.missing_markers
+
+
+def check_docx(source: DocumentSource, template_markers: tuple[str, ...] = ()) -> PreflightResult:
+    """ Бросает PreflightError, если файл не .docx, поврежден или защищен паролем.
+    Если заданы template_markers, проверяет, что все они есть в тексте первой таблицы """
+    stream = _open_stream(source)
+    position = stream.tell()
+
+    try:
+        signature = stream.read(len(_OLE_SIGNATURE))
+        stream.seek(position)
+
+        if signature == _OLE_SIGNATURE:
+            raise PreflightError("Документ защищен паролем или сохранен в формате .doc")
+        if not signature.startswith(_ZIP_SIGNATURE):
+            raise PreflightError("Файл не является документом .docx")
+
+        try:
+            with zipfile.ZipFile(stream) as package:
+                names = set(package.namelist())
+                if DOCUMENT_XML not in names or CONTENT_TYPES_XML not in names:
+                    raise PreflightError("Файл не является документом .docx")
+
+                if any(info.flag_bits & 0x1 for info in package.infolist()):
+                    raise PreflightError("Документ зашифрован")
+
+                if not template_markers:
+                    return PreflightResult()
+
+                table_text = _read_first_table_text(package)
+        except (zipfile.BadZipFile, zlib.error, EOFError) as error:
+            raise PreflightError(f"Файл .docx поврежден: {error}") from error
+
+        return PreflightResult([marker for marker in template_markers if marker not in table_text])
+    finally:
+        if stream is not source:
+            stream.close()
+        else:
+            stream.seek(position)
+
+
+def _open_stream(source: DocumentSource):
+    if isinstance(source, bytes):
+        return io.BytesIO(source)
+
+    if not isinstance(source, str):
+        return source
+
+    if not source.lower().endswith('.docx'):
+        raise PreflightError("Файл должен иметь расширение .docx")
+
+    if not os.path.exists(source):
+        raise FileNotFoundError("Файл не найден.")
+
+    return open(source, 'rb')
+
+
+def _read_first_table_text(package: zipfile.ZipFile) -> str:
+    """ Текст первой таблицы документа без учета разбиения на раны. Пустая строка, если таблицы в начале нет """
+    prefix = ''
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+    with package.open(DOCUMENT_XML) as document:
+        while len(prefix) < _MAX_PREFIX_SIZE:
+            chunk = document.read(_CHUNK_SIZE)
+            if not chunk:
+                break
+
+            prefix += decoder.decode(chunk)
+            table = _find_first_table(prefix)
+            if table is not None:
+                return unescape(''.join(_TEXT_TAG.findall(table)))
+
+    return ''
+
+
+def _find_first_table(xml: str) -> str | None:
+    depth = 0
+    start = None
+
+    for match in _TABLE_TAG.finditer(xml):
+        if match.group().startswith('</'):
+            depth -= 1
+            if depth == 0:
+                return xml[start:match.end()]
+        else:
+            if depth == 0:
+                start = match.start()
+            depth += 1
+
+    return None
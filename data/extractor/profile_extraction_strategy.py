@@ -0,0 +1,64 @@
+import io
+import os
+import zipfile
+
+from lxml import etree
+
+from data.article import ArticleData
+from data.extractor.extraction_strategy import DataExtractionStrategy, DocumentSource
+from data.extractor.preflight import DOCUMENT_XML
+from data.extractor.template_profile import (
+    TemplateProfile, PROFILES, compile_profile, detect_profile, get_fingerprint_markers, match_profile
+)
+from data.memory_profiler import profiler
+
+STYLES_XML = 'word/styles.xml'
+
+
+class ProfileExtractionStrategy(DataExtractionStrategy):
+    """Извлекает статью по профилю шаблона журнала прямо из XML документа.
+
+    Если профиль не задан, он определяется для каждого файла по строкам-отпечаткам первой таблицы,
+    поэтому в одном пакете могут быть статьи разных журналов. При пакетной обработке профиль уже
+    определен быстрой проверкой, и стратегия создается через for_template с готовым профилем.
+    """
+
+    profiles: tuple[TemplateProfile, ...] = PROFILES
+    template_markers = get_fingerprint_markers(PROFILES)
+
+    def __init__(self, profile: TemplateProfile = None):
+        self.profile = profile
+
+    @classmethod
+    def for_template(cls, missing_markers: list[str]) -> "ProfileExtractionStrategy | None":
+        """ Стратегия с уже определенным профилем: в рабочем процессе документ повторно не проверяется """
+        profile = match_profile(missing_markers, cls.profiles)
+        return cls(profile) if profile is not None else None
+
+    def extract_data(self, path: DocumentSource, data_holder: ArticleData):
+        profile = self.profile or detect_profile(path, self.profiles)
+        compiled_profile = compile_profile(profile)
+
+        with profiler.stage('load'):
+            document, styles = self.__read_xml(path)
+        with profiler.stage('table'):
+            compiled_profile.extract_table_data(document, data_holder)
+        with profiler.stage('text'):
+            compiled_profile.extract_text_data(document, styles, data_holder)
+
+    @staticmethod
+    def __read_xml(source: DocumentSource) -> tuple[etree._Element, etree._Element | None]:
+        if isinstance(source, bytes):
+            source = io.BytesIO(source)
+        elif isinstance(source, str):
+            if not source.lower().endswith('.docx'):
+                raise ValueError("Файл должен иметь расширение .docx")
+
+            if not os.path.exists(source):
+                raise FileNotFoundError("Файл не найден.")
+
+        with zipfile.ZipFile(source) as package:
+            document = etree.fromstring(package.read(DOCUMENT_XML))
+            styles = etree.fromstring(package.read(STYLES_XML)) if STYLES_XML in package.namelist() else None
+
+        return document, styles
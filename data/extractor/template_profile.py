@@ -0,0 +1,348 @@
+"""Шаблоны журналов, заданные данными, и их компиляция в извлекатели по XML документа.
+
+Профиль шаблона описывает, в каких ячейках первой таблицы лежат поля статьи, по каким подписям
+они находятся и как оформлены заголовки разделов. compile_profile один раз превращает профиль
+в заранее скомпилированные XPath и регулярные выражения, которые работают прямо с word/document.xml,
+без построения объектной модели python-docx. Профиль файла определяется по строкам-отпечаткам
+в первой таблице (см. preflight.check_docx).
+"""
+
+import re
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+from lxml import etree
+
+from data.article import ArticleData
+from data.author import Author
+from data.enum_const import Language, AuthorRole, Code
+from data.extractor.extraction_strategy import DocumentSource
+from data.extractor.preflight import check_docx
+from data.name_normaliser import to_latin
+from data.workplace import Workplace
+
+W = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+NAMESPACES = {'w': W}
+
+
+@dataclass(frozen=True)
+class TemplateProfile:
+    """Описание шаблона статьи журнала
+
+    Attributes:
+        name (str): Название шаблона
+        fingerprint (tuple(str)): Строки, по наличию которых в первой таблице определяется шаблон
+        info_cell (int): Ячейка первой таблицы со страницами, DOI и датами. Номера ячеек - среди
+            уникальных ячеек таблицы: объединенная ячейка считается один раз
+        authors_cell (int): Ячейка с авторами и индексами мест работы
+        workplaces_cell (int): Ячейка с местами работы
+        abstract_cell (int): Ячейка с аннотацией
+        keywords_cell (int): Ячейка с ключевыми словами
+        pages_paragraph (int): Абзац ячейки info_cell вида 'год, том (выпуск), страницы'
+        abstract_label (str): Регулярное выражение подписи, удаляемой из текста аннотации
+        keywords_label (str): Подпись в начале ячейки ключевых слов
+        keywords_separator (str): Регулярное выражение разделителя ключевых слов
+        doi_label, received_label, accepted_label (str): Регулярные выражения начала абзацев
+            с DOI и датами. Значение - текст абзаца после подписи
+        funding_heading (str): Заголовок раздела финансирования
+        end_heading (str): Заголовок, после которого текст статьи не собирается
+        heading_font (str): Шрифт заголовков разделов
+    """
+    name: str
+    fingerprint: tuple[str, ...]
+    info_cell: int = 2
+    authors_cell: int = 3
+    workplaces_cell: int = 4
+    abstract_cell: int = 5
+    keywords_cell: int = 7
+    pages_paragraph: int = 1
+    abstract_label: str = r'Abstract\n'
+    keywords_label: str = 'Key words:'
+    keywords_separator: str = r',\s+(?![^()]*\))'
+    doi_label: str = r'DOI:'
+    received_label: str = r'Received'
+    accepted_label: str = r'Accepted'
+    funding_heading: str = 'Acknowledgements'
+    end_heading: str = 'Corresponding author'
+    heading_font: str = 'Arial'
+
+
+JOURNAL_PROFILE = TemplateProfile(
+    name='journal',
+    fingerprint=('DOI:', 'Received', 'Accepted', 'Abstract', 'Key words:')
+)
+
+PROFILES: tuple[TemplateProfile, ...] = (JOURNAL_PROFILE,)
+
+
+def _xpath(expression: str) -> etree.XPath:
+    return etree.XPath(expression, namespaces=NAMESPACES)
+
+
+# Объединенная по вертикали ячейка повторяется в каждой строке, кроме первой, с w:vMerge без val="restart"
+_UNIQUE_CELL = "w:tc[not(w:tcPr/w:vMerge[not(@w:val) or @w:val='continue'])]"
+
+_BODY_PARAGRAPHS = _xpath('/w:document/w:body/w:p')
+_PARAGRAPHS = _xpath('w:p')
+_RUNS = _xpath('w:r')
+_TEXT_RUNS = _xpath('w:r | w:hyperlink/w:r')
+_RUN_CONTENT = _xpath('w:br | w:cr | w:noBreakHyphen | w:ptab | w:t | w:tab')
+_VERT_ALIGN = _xpath('string(w:rPr/w:vertAlign/@w:val)')
+_FONT_NAME = _xpath('w:rPr/w:rFonts/@w:ascii')
+_PARAGRAPH_STYLE = _xpath('string(w:pPr/w:pStyle/@w:val)')
+_STYLES = _xpath("/w:styles/w:style[@w:type='paragraph']")
+
+_TAG_TEXT = {
+    f'{{{W}}}cr': '\n',
+    f'{{{W}}}noBreakHyphen': '-',
+    f'{{{W}}}ptab': '\t',
+    f'{{{W}}}tab': '\t',
+}
+_BR = f'{{{W}}}br'
+_T = f'{{{W}}}t'
+_VAL = f'{{{W}}}val'
+
+
+def _toggle(r_pr_parent: etree._Element, name: str) -> bool:
+    """ Включено ли свойство w:b, w:i и т.п. явно, как font.bold is True в python-docx """
+    element = r_pr_parent.find(f'w:rPr/w:{name}', NAMESPACES)
+    return element is not None and element.get(_VAL, 'true').lower() in ('true', '1', 'on')
+
+
+def _run_text(run: etree._Element) -> str:
+    parts = []
+    for element in _RUN_CONTENT(run):
+        if element.tag == _T:
+            parts.append(element.text or '')
+        elif element.tag == _BR:
+            parts.append('\n' if element.get(f'{{{W}}}type', 'textWrapping') == 'textWrapping' else '')
+        else:
+            parts.append(_TAG_TEXT[element.tag])
+    return ''.join(parts)
+
+
+def _paragraph_text(paragraph: etree._Element) -> str:
+    return ''.join(_run_text(run) for run in _TEXT_RUNS(paragraph))
+
+
+def _cell_text(cell: etree._Element) -> str:
+    return '\n'.join(_paragraph_text(paragraph) for paragraph in _PARAGRAPHS(cell))
+
+
+class _StyleBold:
+    """Жирность стилей абзацев из word/styles.xml"""
+
+    def __init__(self, styles: etree._Element | None):
+        self._bold: dict[str, bool] = {}
+        self._default = False
+
+        for style in _STYLES(styles) if styles is not None else []:
+            bold = _toggle(style, 'b')
+            self._bold[style.get(f'{{{W}}}styleId')] = bold
+            if style.get(f'{{{W}}}default') in ('1', 'true', 'on'):
+                self._default = bold
+
+    def __call__(self, paragraph: etree._Element) -> bool:
+        return self._bold.get(_PARAGRAPH_STYLE(paragraph), self._default)
+
+
+class CompiledProfile:
+    """Извлекатель данных статьи по профилю шаблона"""
+
+    def __init__(self, profile: TemplateProfile):
+        self.profile = profile
+
+        cells = f'/w:document/w:body/w:tbl[1]/w:tr/{_UNIQUE_CELL}'
+        self._info_cell = _xpath(f'({cells})[{profile.info_cell + 1}]')
+        self._authors_cell = _xpath(f'({cells})[{profile.authors_cell + 1}]')
+        self._workplaces_cell = _xpath(f'({cells})[{profile.workplaces_cell + 1}]')
+        self._abstract_cell = _xpath(f'({cells})[{profile.abstract_cell + 1}]')
+        self._keywords_cell = _xpath(f'({cells})[{profile.keywords_cell + 1}]')
+
+        self._abstract_label = re.compile(profile.abstract_label)
+        self._keywords_separator = re.compile(profile.keywords_separator)
+        self._doi = re.compile(profile.doi_label + '(.*)', re.DOTALL)
+        self._received = re.compile(profile.received_label + '(.*)', re.DOTALL)
+        self._accepted = re.compile(profile.accepted_label + '(.*)', re.DOTALL)
+
+    def extract_table_data(self, document: etree._Element, data_holder: ArticleData):
+        info_cell = self.__cell(self._info_cell, document)
+        info_paragraphs = [_paragraph_text(paragraph) for paragraph in _PARAGRAPHS(info_cell)]
+
+        data_holder[Language.ENG].abstract = self._abstract_label.sub('', _cell_text(
+            self.__cell(self._abstract_cell, document)
+        ))
+        data_holder[Language.ENG].keywords = self.__extract_keywords(self.__cell(self._keywords_cell, document))
+        data_holder.pages = info_paragraphs[self.profile.pages_paragraph].split(',')[-1].strip()
+        doi = self.__find_value(self._doi, info_paragraphs)
+        data_holder.codes[Code.DOI] = [doi.strip()] if doi is not None else None
+        received = self.__find_value(self._received, info_paragraphs)
+        data_holder.received_date = received.strip(', ') if received is not None else None
+        accepted = self.__find_value(self._accepted, info_paragraphs)
+        data_holder.accepted_date = accepted.strip(', ') if accepted is not None else None
+        data_holder.authors = self.__extract_authors(
+            self.__cell(self._authors_cell, document),
+            self.__cell(self._workplaces_cell, document)
+        )
+
+    def extract_text_data(self, document: etree._Element, styles: etree._Element | None, data_holder: ArticleData):
+        is_style_bold = _StyleBold(styles)
+        is_funding_text = False
+        text = []
+        funding = []
+
+        for paragraph in _BODY_PARAGRAPHS(document):
+            paragraph_text = _paragraph_text(paragraph)
+
+            if self.__is_heading(paragraph, is_style_bold):
+
+                if paragraph_text.strip() == self.profile.funding_heading:
+                    is_funding_text = True
+                elif paragraph_text.strip() == self.profile.end_heading:
+                    break
+
+                if paragraph_text:
+                    # Заголовок добавляется без номера в начале
+                    text.append(paragraph_text.strip("0123456789. "))
+                    continue
+
+            text.append(paragraph_text)
+
+            if is_funding_text:
+                funding.append(paragraph_text)
+
+        data_holder[Language.ENG].text += ' '.join(text).strip()
+        data_holder[Language.ENG].funding += ' '.join(funding).strip()
+
+    @staticmethod
+    def __cell(xpath: etree.XPath, document: etree._Element) -> etree._Element:
+        cells = xpath(document)
+        if not cells:
+            raise ValueError("В первой таблице документа нет ячейки, указанной в шаблоне")
+        return cells[0]
+
+    @staticmethod
+    def __find_value(label: re.Pattern, paragraphs: list[str]) -> str | None:
+        for paragraph in paragraphs:
+            if match := label.match(paragraph):
+                return match.group(1)
+        return None
+
+    def __is_heading(self, paragraph: etree._Element, is_style_bold: _StyleBold) -> bool:
+        runs = _RUNS(paragraph)
+        is_bold = is_style_bold(paragraph) or all(_toggle(run, 'b') for run in runs)
+        heading_font = self.profile.heading_font.lower()
+        return is_bold and all(not name or name.lower() == heading_font for run in runs for name in _FONT_NAME(run))
+
+    def __extract_keywords(self, cell: etree._Element) -> list[str]:
+        formatted_text = []
+        remaining_chars_to_skip = len(self.profile.keywords_label)
+
+        for paragraph in _PARAGRAPHS(cell):
+            for run in _RUNS(paragraph):
+                run_text = _run_text(run)
+
+                if remaining_chars_to_skip > 0:
+                    if len(run_text) <= remaining_chars_to_skip:
+                        remaining_chars_to_skip -= len(run_text)
+                        continue
+
+                    run_text = run_text[remaining_chars_to_skip:]
+                    remaining_chars_to_skip = 0
+
+                if _toggle(run, 'i'):
+                    run_text = f"<i>{run_text}</i>"
+                if _toggle(run, 'b'):
+                    run_text = f"<b>{run_text}</b>"
+                if _VERT_ALIGN(run) == 'subscript':
+                    run_text = f"<sub>{run_text}</sub>"
+                if _VERT_ALIGN(run) == 'superscript':
+                    run_text = f"<sup>{run_text}</sup>"
+
+                formatted_text.append(run_text)
+
+        return [keyword.strip('. ') for keyword in self._keywords_separator.split(''.join(formatted_text))]
+
+    def __extract_authors(self, authors_cell: etree._Element, workplaces_cell: etree._Element) -> list[Author]:
+        workplaces = self.__extract_workplaces(workplaces_cell)
+        authors: list[Author] = [Author()]
+        author_indexes: list[str] = []
+
+        for paragraph in _PARAGRAPHS(authors_cell):
+            is_workplace_index = False
+            for run in _RUNS(paragraph):
+                run_text = _run_text(run)
+                if _VERT_ALIGN(run) == 'superscript' and run_text.strip('\n '):
+                    if not is_workplace_index: author_indexes.append('')
+                    author_indexes[-1] += run_text
+                    is_workplace_index = True
+                elif run_text.strip():
+                    if run_text.strip().startswith('and '):
+                        authors[-1][Language.ENG].surname += run_text[4:]
+                    else:
+                        authors[-1][Language.ENG].surname += run_text
+
+                    if '*' in run_text: authors[-1].role = AuthorRole.Corresponding
+                    if ',' in run_text: authors.append(Author())
+                    is_workplace_index = False
+
+        for i, author in enumerate(authors):
+            author[Language.ENG].initials, author[Language.ENG].surname = (
+                author[Language.ENG].surname.strip(' ,*').rsplit(maxsplit=1))
+
+            author[Language.ENG].workplaces = [
+                workplaces[to_latin(index.strip())]
+                for index in author_indexes[i].split(',')
+            ]
+
+        return authors
+
+    @staticmethod
+    def __extract_workplaces(workplaces_cell: etree._Element) -> dict[str, Workplace]:
+        workplaces: dict[str, Workplace] = {}
+        workplace_index = ''
+        workplace_text = ''
+
+        for paragraph in _PARAGRAPHS(workplaces_cell):
+            runs = _RUNS(paragraph)
+            if runs and _VERT_ALIGN(runs[0]) == 'superscript':
+                if workplace_text:
+                    text = workplace_text.replace('\n', ' ')
+                    workplaces[to_latin(workplace_index)] = Workplace.Builder().parse(text).build()
+
+                workplace_index = _run_text(runs[0]).strip()
+                workplace_text = ''.join(_run_text(run) for run in runs[1:])
+            else:
+                workplace_text += _paragraph_text(paragraph)
+
+        text = workplace_text.replace('\n', ' ')
+        workplaces[to_latin(workplace_index)] = Workplace.Builder().parse(text).build()
+
+        return workplaces
+
+
+@lru_cache(maxsize=None)
+def compile_profile(profile: TemplateProfile) -> CompiledProfile:
+    return CompiledProfile(profile)
+
+
+def get_fingerprint_markers(profiles: tuple[TemplateProfile, ...] = PROFILES) -> tuple[str, ...]:
+    return tuple(dict.fromkeys(marker for profile in profiles for marker in profile.fingerprint))
+
+
+def match_profile(missing_markers: list[str],
+                  profiles: tuple[TemplateProfile, ...] = PROFILES) -> TemplateProfile | None:
+    """ Первый профиль, все строки-отпечатки которого нашлись в первой таблице """
+    missing = set(missing_markers)
+    return next((profile for profile in profiles if missing.isdisjoint(profile.fingerprint)), None)
+
+
+def detect_profile(source: DocumentSource, profiles: tuple[TemplateProfile, ...] = PROFILES) -> TemplateProfile:
+    preflight = check_docx(source, get_fingerprint_markers(profiles))
+    profile = match_profile(preflight.missing_markers, profiles)
+
+    if profile is None:
+        raise ValueError("Документ не соответствует ни одному шаблону журнала")
+
+    return profile
@@ -0,0 +1,61 @@
+"""Замеры памяти, выделенной при извлечении данных, по этапам с помощью tracemalloc"""
+
+import tracemalloc
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+
+@dataclass
+class MemoryUsage:
+    """Пиковые объемы памяти, выделенной Python при обработке одного файла
+
+    Attributes:
+        peak (int): Пик за всю обработку файла в байтах
+        stages (dict(str, int)): Пик каждого этапа в байтах относительно начала обработки
+    """
+    peak: int = 0
+    stages: dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return {'peak': self.peak, 'stages': dict(self.stages)}
+
+
+class MemoryProfiler:
+    """Замеряет пики tracemalloc по этапам. Пока замер не запущен, stage ничего не делает.
+
+    Замер глобален для процесса, поэтому запускается только в рабочем процессе IsolatedWorker,
+    где обрабатывается ровно один файл. Этапы не должны быть вложенными.
+    """
+
+    def __init__(self):
+        self._usage: MemoryUsage | None = None
+        self._baseline = 0
+
+    def start(self):
+        tracemalloc.start()
+        self._baseline = tracemalloc.get_traced_memory()[0]
+        self._usage = MemoryUsage()
+
+    def stop(self) -> MemoryUsage | None:
+        usage, self._usage = self._usage, None
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        return usage
+
+    @contextmanager
+    def stage(self, name: str):
+        if self._usage is None:
+            yield
+            return
+
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            peak = max(tracemalloc.get_traced_memory()[1] - self._baseline, 0)
+            self._usage.stages[name] = max(self._usage.stages.get(name, 0), peak)
+            self._usage.peak = max(self._usage.peak, peak)
+
+
+profiler = MemoryProfiler()
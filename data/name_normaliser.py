@@ -0,0 +1,143 @@
+"""Заполнение имен авторов на втором языке транслитерацией"""
+
+import re
+
+from functools import lru_cache
+
+from unidecode import unidecode
+
+from data.article import ArticleData
+from data.author import Author
+from data.enum_const import Language
+
+# Имена в выпуске повторяются, поэтому транслитерации запоминаются. Размер ограничен, чтобы
+# долгая сессия с многими выпусками не копила память
+CACHE_SIZE = 4096
+
+# Частые имена, в которых транслитерация теряет мягкий знак или окончание
+_KNOWN_NAMES = {
+    'alexander': 'александр',
+    'daria': 'дарья',
+    'darya': 'дарья',
+    'dmitri': 'дмитрий',
+    'igor': 'игорь',
+    'ilya': 'илья',
+    'lyubov': 'любовь',
+    'natalya': 'наталья',
+    'olga': 'ольга',
+    'tatiana': 'татьяна',
+    'tatyana': 'татьяна',
+    'yuri': 'юрий',
+}
+
+# Правила обратной транслитерации латиницы в кириллицу. Порядок важен: более длинные и
+# контекстные правила стоят раньше, чем отдельные буквы
+_CYRILLIC_RULES = (
+    (r'sk(?:y|iy|ii)\b', 'ский'),
+    (r'(?:iy|ii)\b', 'ий'),
+    (r'yy\b', 'ый'),
+    (r'(?<=[bdfgklmnprstvz])yev\b', 'ьев'),
+    (r'(?<=[bdfgklmnprstvz])yov\b', 'ьёв'),
+    (r'(?<=[bdfgklmnprstvz])y\b', 'ий'),
+    (r'ia\b', 'ия'),
+    (r'shch', 'щ'),
+    (r'zh', 'ж'),
+    (r'kh', 'х'),
+    (r'ts', 'ц'),
+    (r'ch', 'ч'),
+    (r'sh', 'ш'),
+    (r'yu', 'ю'),
+    (r'ya', 'я'),
+    (r'yo', 'ё'),
+    (r'ye', 'е'),
+    (r'(?<=[aeiouy])y', 'й'),
+    (r'y', 'ы'),
+    (r'x', 'кс'),
+    (r'j', 'дж'),
+    (r'w', 'в'),
+    (r'q', 'к'),
+    (r'c', 'к'),
+    (r'h', 'х'),
+    (r"'", 'ь'),
+    *zip('abvgdezijklmnoprstuf', 'абвгдезийклмнопрстуф'),
+)
+
+_CYRILLIC_PATTERN = re.compile(
+    '|'.join(f'(?P<g{i}>{pattern})' for i, (pattern, _) in enumerate(_CYRILLIC_RULES)),
+    re.IGNORECASE
+)
+
+_WORD = re.compile(r"[A-Za-z']+")
+
+
+def _match_case(source: str, result: str) -> str:
+    if len(source) > 1 and source.isupper():
+        return result.upper()
+    if source[0].isupper():
+        return result[0].upper() + result[1:]
+    return result
+
+
+def _replace_with_cyrillic(match: re.Match) -> str:
+    return _match_case(match.group(), _CYRILLIC_RULES[int(match.lastgroup[1:])][1])
+
+
+def _word_to_cyrillic(match: re.Match) -> str:
+    word = match.group()
+    if (known := _KNOWN_NAMES.get(word.lower())) is not None:
+        return _match_case(word, known)
+    return _CYRILLIC_PATTERN.sub(_replace_with_cyrillic, word)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def to_latin(text: str) -> str:
+    return unidecode(text)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def to_cyrillic(text: str) -> str:
+    return _WORD.sub(_word_to_cyrillic, text)
+
+
+class NameNormaliser:
+    """Заполняет пустые фамилии и инициалы авторов на другом языке.
+
+    Авторы статьи извлекаются на английском и получают русские поля обратной транслитерацией,
+    рецензенты - наоборот. Уже заполненные поля не меняются. Места работы не транслитерируются:
+    побуквенная транслитерация названий организаций и стран дает неверный текст, поэтому
+    они остаются пустыми.
+    """
+
+    _TRANSLITERATIONS = {
+        (Language.ENG, Language.RUS): to_cyrillic,
+        (Language.RUS, Language.ENG): to_latin,
+    }
+
+    def normalise(self, articles: list[ArticleData]):
+        # Сначала собираем все строки пакета, чтобы каждая уникальная транслитерировалась один раз
+        pending: dict[tuple[Language, Language], set[str]] = {key: set() for key in self._TRANSLITERATIONS}
+
+        for author, source_lang, target_lang in self.__missing_languages(articles):
+            pending[source_lang, target_lang].update((author[source_lang].surname, author[source_lang].initials))
+
+        translated = {
+            key: {text: self._TRANSLITERATIONS[key](text) for text in strings}
+            for key, strings in pending.items()
+        }
+
+        for author, source_lang, target_lang in list(self.__missing_languages(articles)):
+            names = translated[source_lang, target_lang]
+            author[target_lang].surname = names[author[source_lang].surname]
+            author[target_lang].initials = names[author[source_lang].initials]
+
+    def __missing_languages(self, articles: list[ArticleData]):
+        """ Авторы, у которых на одном языке фамилия есть, а на другом нет """
+        for data in articles:
+            for author in data.authors:
+                for source_lang, target_lang in self._TRANSLITERATIONS:
+                    if self.__has_name(author, source_lang) and not self.__has_name(author, target_lang):
+                        yield author, source_lang, target_lang
+
+    @staticmethod
+    def __has_name(author: Author, lang: Language) -> bool:
+        return lang in author and bool(author[lang].surname)
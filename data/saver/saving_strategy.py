@@ -7,6 +7,7 @@ from html import escape
 from xml.etree.ElementTree import Element
 from xml.dom import minidom
 
+from data import article_codec
 from data.article import ArticleData
 from data.author import Author
 from data.enum_const import Language, AuthorRole
@@ -26,6 +27,14 @@ class DocxSavingStrategy(DataSavingStrategy):
         path = saving_path + '.docx'
 
 
+class BinarySavingStrategy(DataSavingStrategy):
+    """Сохраняет извлеченные данные в двоичном формате article_codec для повторного формирования выходных файлов"""
+
+    def save_data(self, saving_path: str, data: ArticleData):
+        with open(saving_path + article_codec.EXTENSION, 'wb') as f:
+            f.write(article_codec.encode(data))
+
+
 class XMLSavingStrategy(DataSavingStrategy):
 
     def save_data(self, saving_path: str, data: ArticleData):
@@ -1,24 +1,32 @@
 import tkinter as tk
-from tkinter import filedialog
+from tkinter import filedialog, messagebox, ttk
 from typing import Callable
 from pathlib import Path
 
-from progress_window import ProgressWindow
+from data.batch.article_job import ArchiveMember
+from data.batch.batch_processor import BatchReport
 from data.enum_const import FileType
+from view_model.job_queue_view_model import JobQueueViewModel
 from view_model.main_view_model import MainViewModel
 
 
 class InfoExtractorApp:
-    view_model = MainViewModel()
+    # Период опроса событий очереди заданий, мс
+    POLL_INTERVAL = 100
 
     def __init__(self, root):
         self.root = root
         self.root.title('InfoExtractorApp')
         self.root.minsize(400, 250)
         self.labels = []
+        self.label_names = []
 
-        # Окно прогресса | открывается при вызове open()
-        progress_window = ProgressWindow(root)
+        # Файлы текущей статьи. После добавления в очередь создается новая модель для следующей статьи
+        self.view_model = MainViewModel()
+        self.job_queue = JobQueueViewModel()
+
+        # Очередь опрашивается, пока в ней есть запущенные задания
+        self.is_polling = False
 
         # Создаем надписи и кнопки
         self.file_selector_button(
@@ -52,16 +60,48 @@ class InfoExtractorApp:
             )
         )
 
-        # Кнопка для извлечения информации
+        # Кнопки для добавления заданий в очередь
+        buttons_frame = tk.Frame(root)
+        buttons_frame.pack(fill='x', padx=5, pady=5)
+
         tk.Button(
-            root,
+            buttons_frame,
+            text='Добавить в очередь',
+            command=self.add_job
+        ).pack(side=tk.RIGHT)
+
+        tk.Button(
+            buttons_frame,
+            text='Добавить выпуск (.zip)',
+            command=self.add_archive
+        ).pack(side=tk.RIGHT, padx=5)
+
+        # Очередь заданий: по строке на статью
+        self.jobs_table = ttk.Treeview(root, columns=('article', 'reviews', 'status'), show='headings', height=6)
+        self.jobs_table.heading('article', text='Статья')
+        self.jobs_table.heading('reviews', text='Рецензий')
+        self.jobs_table.heading('status', text='Состояние')
+        self.jobs_table.column('reviews', width=70, anchor=tk.CENTER, stretch=False)
+        self.jobs_table.column('status', width=160, stretch=False)
+        self.jobs_table.pack(fill='both', expand=True, padx=5)
+
+        # Общий прогресс очереди. Он в главном окне, а не в модальном, чтобы во время обработки
+        # можно было выбирать и запускать следующие статьи
+        progress_frame = tk.Frame(root)
+        progress_frame.pack(fill='x', padx=5, pady=5)
+
+        self.progress_label = tk.Label(progress_frame, text='0%', width=5)
+        self.progress_label.pack(side=tk.LEFT)
+
+        self.progressbar = ttk.Progressbar(progress_frame, mode='determinate')
+        self.progressbar.pack(side=tk.LEFT, fill='x', expand=True, padx=5)
+
+        # Кнопка для извлечения информации из всех статей очереди
+        tk.Button(
+            progress_frame,
             text='Извлечь информацию',
-            command=lambda: (
-                progress_window.open(),
-                self.view_model.extract_data(progress_window.update_progress),
-                self.view_model.save_data(self.select_saving_path(), progress_window.update_progress)
-            )
-        ).pack(anchor=tk.NE, padx=5, pady=5)
+            command=self.run_jobs
+        ).pack(side=tk.RIGHT)
 
         # Кнопка для создания выпуска
         tk.Button(
@@ -77,6 +117,7 @@ class InfoExtractorApp:
         label = tk.Label(frame, text=name,  fg="gray")
         label.pack(side=tk.LEFT)
         self.labels.append(label)
+        self.label_names.append(name)
 
         button = tk.Button(frame, text='Выбрать файл', command=button_command)
         button.pack(side=tk.RIGHT)
@@ -95,6 +136,97 @@ class InfoExtractorApp:
             self.view_model.set_file_paths(file_type, [path])
             self.labels[index].config(text=Path(path).name, fg='black')
 
+    def add_job(self):
+        if not self.view_model.has_article():
+            messagebox.showwarning('InfoExtractorApp', 'Выберите файл статьи')
+            return
+
+        saving_path = self.select_saving_path()
+        if not saving_path:
+            return
+
+        index = self.job_queue.add_job(self.view_model.to_job(saving_path))
+        self.insert_job_row(index)
+
+        # Следующая статья выбирается с чистого листа
+        self.view_model = MainViewModel()
+        for label, name in zip(self.labels, self.label_names):
+            label.config(text=name, fg='gray')
+
+    def add_archive(self):
+        archive_path = filedialog.askopenfilename(filetypes=[('Zip', '.zip')])
+        if not archive_path:
+            return
+
+        try:
+            indexes = self.job_queue.add_archive(archive_path, str(Path(archive_path).parent))
+        except (OSError, ValueError) as error:
+            messagebox.showerror('InfoExtractorApp', str(error))
+            return
+
+        for index in indexes:
+            self.insert_job_row(index)
+
+    def insert_job_row(self, index: int):
+        queued = self.job_queue.jobs[index]
+        self.jobs_table.insert(
+            '', tk.END, iid=str(index),
+            values=(self.source_name(queued.job.article), len(queued.job.reviews), queued.status.value)
+        )
+
+    def update_job_row(self, index: int):
+        queued = self.job_queue.jobs[index]
+        status = queued.status.value
+        if queued.errors:
+            status += f' ({len(queued.errors)} ош.)'
+        self.jobs_table.set(str(index), 'status', status)
+
+    def run_jobs(self):
+        # Выбранная, но не добавленная статья обрабатывается вместе с очередью
+        if self.view_model.has_article():
+            self.add_job()
+
+        if self.job_queue.run() and not self.is_polling:
+            self.is_polling = True
+            self.root.after(self.POLL_INTERVAL, self.poll_jobs)
+
+    def poll_jobs(self):
+        for event in self.job_queue.poll_events():
+            match event:
+                case ('progress', percent):
+                    self.set_progress(percent)
+                case ('job', index):
+                    self.update_job_row(index)
+                case ('finished', report):
+                    self.set_progress(100)
+                    self.show_report(report)
+
+        # После завершения могли запустить новые задания, тогда опрос продолжается
+        if self.job_queue.is_running or not self.job_queue.events.empty():
+            self.root.after(self.POLL_INTERVAL, self.poll_jobs)
+        else:
+            self.is_polling = False
+
+    def set_progress(self, percent: float):
+        self.progressbar['value'] = percent
+        self.progress_label.config(text=f'{int(percent)}%')
+
+    @staticmethod
+    def source_name(source: str | ArchiveMember) -> str:
+        # У файлов архива - путь внутри архива: в папках статей выпуска файлы часто называются одинаково
+        return source.display_name if isinstance(source, ArchiveMember) else Path(source).name
+
+    def show_report(self, report: BatchReport):
+        messages = []
+        for result in report.results:
+            names = {str(source): self.source_name(source) for source in (result.job.article, *result.job.reviews)}
+            messages.extend(
+                f'{names.get(error.source, Path(error.source).name)}: {error.message}' for error in result.errors
+            )
+
+        if messages:
+            messagebox.showwarning('InfoExtractorApp', '\n'.join(messages))
+
     def select_saving_path(self) -> str:
         article_path = self.view_model.get_article_path()
         article_name = Path(article_path).stem
@@ -107,7 +239,7 @@ class InfoExtractorApp:
             filetypes=[('XML', '.xml')]
         )
 
-        return str(Path(saving_path).with_suffix(''))
+        return str(Path(saving_path).with_suffix('')) if saving_path else ''
 
 if __name__ == "__main__":
     root = tk.Tk()
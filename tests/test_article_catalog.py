@@ -0,0 +1,64 @@
+import unittest
+
+from data.article import ArticleData
+from data.author import Author
+from data.catalog.article_catalog import ArticleCatalog, ReviewerConflict
+from data.enum_const import Language, AuthorRole
+
+
+def _author(role: AuthorRole = AuthorRole.Default, **names: tuple[str, str]) -> Author:
+    author = Author()
+    author.role = role
+    for lang, (surname, initials) in names.items():
+        author[Language[lang]].surname = surname
+        author[Language[lang]].initials = initials
+    return author
+
+
+class ReviewerConflictsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.catalog = ArticleCatalog(':memory:')
+
+        # Имена в двух языках дают разные ключи: 'smith ab' и 'smitkh ab'
+        catalogued = ArticleData()
+        catalogued.authors = [
+            _author(ENG=('Smith', 'A. B.'), RUS=('Смитх', 'А. Б.')),
+            _author(ENG=('Jones', 'C.'), RUS=('Джонес', 'С.')),
+        ]
+        self.catalog.add([('old.docx', catalogued)])
+
+    def tearDown(self):
+        self.catalog.close()
+
+    def test_conflict_is_reported_once(self):
+        data = ArticleData()
+        data.authors = [
+            _author(ENG=('Smith', 'A. B.'), RUS=('Смитх', 'А. Б.')),
+            _author(AuthorRole.Reviewer, ENG=('Jones', 'C.'), RUS=('Джонес', 'С.')),
+        ]
+
+        self.assertEqual(
+            self.catalog.find_reviewer_conflicts(data),
+            [ReviewerConflict('Джонес С.', 'Смитх А. Б.', 'old.docx')]
+        )
+
+    def test_reviewer_among_authors_is_reported_once(self):
+        data = ArticleData()
+        data.authors = [
+            _author(ENG=('Smith', 'A. B.'), RUS=('Смитх', 'А. Б.')),
+            _author(AuthorRole.Reviewer, ENG=('Smith', 'A. B.'), RUS=('Смитх', 'А. Б.')),
+        ]
+
+        self.assertEqual(
+            [conflict for conflict in self.catalog.find_reviewer_conflicts(data) if not conflict.source],
+            [ReviewerConflict('Смитх А. Б.', 'Смитх А. Б.')]
+        )
+
+    def test_find_by_person_in_any_language(self):
+        self.assertEqual(self.catalog.find_by_person('Smith', 'A.B.'), ['old.docx'])
+        self.assertEqual(self.catalog.find_by_person('Смитх', 'А. Б.'), ['old.docx'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+import zipfile
+
+from data.batch.issue_archive import read_issue_archive
+
+
+class _LegacyNameInfo(zipfile.ZipInfo):
+    """Имя записывается в заданной кодировке без флага UTF-8, как у Info-ZIP и Проводника Windows"""
+
+    encoding = 'utf-8'
+
+    def _encodeFilenameFlags(self):
+        return self.filename.encode(self.encoding), self.flag_bits & ~0x800
+
+
+class ReadIssueArchiveTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.archive_path = os.path.join(self.directory.name, 'issue.zip')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _write_archive(self, names: list[str], encoding: str = None):
+        with zipfile.ZipFile(self.archive_path, 'w') as archive:
+            for name in names:
+                if encoding is None:
+                    info = zipfile.ZipInfo(name)
+                else:
+                    info = _LegacyNameInfo(name)
+                    info.encoding = encoding
+                archive.writestr(info, b'docx')
+
+    def _check_cyrillic_names(self, encoding: str = None):
+        self._write_archive(['a1/Статья.docx', 'a1/referee_report_1_Иванов_ИИ.docx'], encoding)
+
+        job, = read_issue_archive(self.archive_path, 'out')
+        review, = job.reviews
+
+        self.assertEqual(job.article.display_name, 'a1/Статья.docx')
+        self.assertEqual(job.saving_path, os.path.join('out', 'a1_Статья_EL'))
+        self.assertEqual(review.open().name, 'a1/referee_report_1_Иванов_ИИ.docx')
+        self.assertEqual(review.open().read(), b'docx')
+        self.assertEqual(str(review), f'{self.archive_path}:a1/referee_report_1_Иванов_ИИ.docx')
+
+    def test_utf8_flag(self):
+        self._check_cyrillic_names()
+
+    def test_utf8_without_flag(self):
+        self._check_cyrillic_names('utf-8')
+
+    def test_cp866_without_flag(self):
+        self._check_cyrillic_names('cp866')
+
+    def test_same_file_names_in_folders(self):
+        self._write_archive(['a1/manuscript.docx', 'a2/manuscript.docx'])
+
+        saving_paths = [job.saving_path for job in read_issue_archive(self.archive_path, 'out')]
+
+        self.assertEqual(saving_paths, [os.path.join('out', 'a1_manuscript_EL'), os.path.join('out', 'a2_manuscript_EL')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+
+from data.article import ArticleData
+from data.author import Author
+from data.enum_const import Language, AuthorRole
+from data.name_normaliser import NameNormaliser, to_cyrillic
+from data.workplace import Workplace
+
+
+class ToCyrillicTest(unittest.TestCase):
+
+    def test_names(self):
+        cases = {
+            'E. A.': 'Е. А.',
+            'Yu. V.': 'Ю. В.',
+            'Elena': 'Елена',
+            'Evgeny': 'Евгений',
+            'Evgenia': 'Евгения',
+            'Natalia': 'Наталия',
+            'Olga': 'Ольга',
+            'Tatyana': 'Татьяна',
+            'Dmitry': 'Дмитрий',
+            'Sergey': 'Сергей',
+            'Pyotr': 'Пётр',
+            'Ekaterina': 'Екатерина',
+        }
+        for latin, cyrillic in cases.items():
+            with self.subTest(latin=latin):
+                self.assertEqual(to_cyrillic(latin), cyrillic)
+
+    def test_surnames(self):
+        cases = {
+            'Petrova': 'Петрова',
+            'Kuznetsov': 'Кузнецов',
+            'Zhukovsky': 'Жуковский',
+            'Shcherbakov': 'Щербаков',
+            'Vasilyev': 'Васильев',
+            'Solovyov': 'Соловьёв',
+            'Tolstoy': 'Толстой',
+        }
+        for latin, cyrillic in cases.items():
+            with self.subTest(latin=latin):
+                self.assertEqual(to_cyrillic(latin), cyrillic)
+
+    def test_case(self):
+        self.assertEqual(to_cyrillic('OLGA'), 'ОЛЬГА')
+        self.assertEqual(to_cyrillic('elena'), 'елена')
+
+
+class NameNormaliserTest(unittest.TestCase):
+
+    @staticmethod
+    def _article() -> ArticleData:
+        data = ArticleData()
+
+        author = Author()
+        author[Language.ENG].surname = 'Petrova'
+        author[Language.ENG].initials = 'E. A.'
+        author[Language.ENG].workplaces = [Workplace('Lomonosov Moscow State University', 'Moscow', 'Russia')]
+
+        reviewer = Author()
+        reviewer.role = AuthorRole.Reviewer
+        reviewer[Language.RUS].surname = 'Иванов'
+        reviewer[Language.RUS].initials = 'И. И.'
+
+        data.authors = [author, reviewer]
+        return data
+
+    def test_fills_names_in_both_directions(self):
+        data = self._article()
+        NameNormaliser().normalise([data])
+        author, reviewer = data.authors
+
+        self.assertEqual((author[Language.RUS].surname, author[Language.RUS].initials), ('Петрова', 'Е. А.'))
+        self.assertEqual((reviewer[Language.ENG].surname, reviewer[Language.ENG].initials), ('Ivanov', 'I. I.'))
+
+    def test_leaves_workplaces_empty(self):
+        data = self._article()
+        NameNormaliser().normalise([data])
+
+        self.assertEqual(data.authors[0][Language.RUS].workplaces, [])
+
+    def test_keeps_filled_names(self):
+        data = self._article()
+        data.authors[0][Language.RUS].surname = 'Петрова-Водкина'
+        NameNormaliser().normalise([data])
+
+        self.assertEqual(data.authors[0][Language.RUS].surname, 'Петрова-Водкина')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+import queue
+import threading
+
+from dataclasses import dataclass, field
+from enum import Enum
+
+from data.batch.article_job import ArticleJob
+from data.batch.batch_processor import BatchProcessor, BatchReport, JobResult
+from data.batch.isolated_worker import FileError, ErrorKind
+from data.batch.issue_archive import read_issue_archive
+
+
+class JobStatus(Enum):
+    Waiting = 'В очереди'
+    Processing = 'Обработка'
+    Done = 'Готово'
+    Failed = 'Ошибка'
+
+
+@dataclass
+class QueuedJob:
+    """Задание в очереди
+
+    Attributes:
+        job (ArticleJob): Файлы статьи и путь сохранения
+        status (JobStatus): Состояние задания
+        errors (list(FileError)): Ошибки последней обработки
+    """
+    job: ArticleJob
+    status: JobStatus = JobStatus.Waiting
+    errors: list[FileError] = field(default_factory=list)
+
+
+class JobQueueViewModel:
+    """Очередь статей, обрабатываемых параллельно в фоне.
+
+    Обработка идет в отдельном потоке, поэтому о ходе работы сообщается через events, а не колбэками:
+    интерфейс забирает события методом poll_events из своего потока. События:
+        ('progress', percent) - общий прогресс всех запущенных заданий в процентах
+        ('job', index) - изменилось состояние задания jobs[index]
+        ('finished', BatchReport) - запущенные задания обработаны, отчет по всем им
+    Задания, запущенные во время обработки, поток берет следующей партией, не дожидаясь нового запуска.
+    """
+
+    def __init__(self, batch_processor: BatchProcessor = None):
+        self.jobs: list[QueuedJob] = []
+        self.events: queue.Queue = queue.Queue()
+        self._batch_processor = batch_processor or BatchProcessor()
+        self._lock = threading.Lock()
+        self._scheduled: list[int] = []
+        self._thread: threading.Thread | None = None
+        # Прогресс считается в заданиях: партии разного размера складываются в одну шкалу
+        self._started_jobs = 0
+        self._done_jobs = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        with self._lock:
+            return self._thread is not None
+
+    def add_job(self, job: ArticleJob) -> int:
+        with self._lock:
+            self.jobs.append(QueuedJob(job))
+            return len(self.jobs) - 1
+
+    def add_archive(self, archive_path: str, saving_dir: str) -> list[int]:
+        return [self.add_job(job) for job in read_issue_archive(archive_path, saving_dir)]
+
+    def run(self) -> bool:
+        """ Запускает обработку ожидающих заданий. Если очередь уже обрабатывается, задания
+        обрабатываются следующей партией. False, если ожидающих заданий нет """
+        with self._lock:
+            indexes = [i for i, queued in enumerate(self.jobs) if queued.status is JobStatus.Waiting]
+            if not indexes:
+                return False
+
+            for i in indexes:
+                self.jobs[i].status = JobStatus.Processing
+                self.events.put(('job', i))
+
+            self._scheduled.extend(indexes)
+            self._started_jobs += len(indexes)
+            self.__put_progress()
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self.__process_scheduled, daemon=True)
+                self._thread.start()
+
+        return True
+
+    def poll_events(self) -> list[tuple]:
+        events = []
+        while True:
+            try:
+                events.append(self.events.get_nowait())
+            except queue.Empty:
+                return events
+
+    def __process_scheduled(self):
+        report = BatchReport()
+
+        while True:
+            with self._lock:
+                indexes, self._scheduled = self._scheduled, []
+                if not indexes:
+                    self._thread = None
+                    self._started_jobs = 0
+                    self._done_jobs = 0.0
+                    break
+
+            report.results.extend(self.__process(indexes).results)
+
+        self.events.put(('finished', report))
+
+    def __process(self, indexes: list[int]) -> BatchReport:
+        index_by_job = {id(self.jobs[i].job): i for i in indexes}
+
+        def on_progress(percent: float):
+            with self._lock:
+                self._done_jobs += percent / 100 * len(indexes)
+                self.__put_progress()
+
+        def on_job_finished(result: JobResult):
+            i = index_by_job[id(result.job)]
+            self.jobs[i].errors = result.errors
+            self.jobs[i].status = JobStatus.Done if result.data is not None else JobStatus.Failed
+            self.events.put(('job', i))
+
+        try:
+            return self._batch_processor.process(
+                [self.jobs[i].job for i in indexes],
+                progress_callback=on_progress,
+                job_callback=on_job_finished
+            )
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            # Сбой самой очереди (например, каталога) не должен оставить интерфейс в ожидании
+            for i in indexes:
+                if self.jobs[i].status is JobStatus.Processing:
+                    self.jobs[i].status = JobStatus.Failed
+                    self.jobs[i].errors = [FileError(str(self.jobs[i].job.article), ErrorKind.EXCEPTION, str(error))]
+                    self.events.put(('job', i))
+            return BatchReport()
+
+    def __put_progress(self):
+        """ Вызывается под self._lock """
+        self.events.put(('progress', min(100 * self._done_jobs / self._started_jobs, 100)))
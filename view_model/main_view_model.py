@@ -1,50 +1,14 @@
-from typing import Callable
-
-from data.article import ArticleData
+from data.batch.article_job import ArticleJob
 from data.enum_const import FileType
-from data.extractor.data_extractor import DataExtractor
-from data.extractor.extraction_strategy import ArticleExtractionStrategy, ReviewExtractionStrategy
-from data.saver.data_saver import DataSaver
-from data.saver.saving_strategy import XMLSavingStrategy, DocxSavingStrategy
 
 
 class MainViewModel:
+    """Файлы одной статьи, выбранные в интерфейсе. Извлечение и сохранение выполняет очередь заданий
+    (JobQueueViewModel), поэтому модель только собирает из выбранных файлов задание ArticleJob"""
 
-    _article_data = ArticleData()
-    _data_extractor = DataExtractor()
-    _data_saver = DataSaver()
-
-    _filepaths: dict[FileType, list[str]] = {}
-
-    _saving_strategies = (XMLSavingStrategy, DocxSavingStrategy)
-
-    _progress_elements = len(_saving_strategies)
-
-    def extract_data(self, progress_callback: Callable):
-        self._progress_elements += sum(map(len, self._filepaths.values()))
-
-        for file_type, paths in self._filepaths.items():
-            """ Устанавливаем стратегию в зависимости от типа файлов """
-            match file_type:
-                case (FileType.Article):
-                    self._data_extractor.set_strategy(ArticleExtractionStrategy())
-                case (FileType.Review):
-                    self._data_extractor.set_strategy(ReviewExtractionStrategy())
-
-            for path in paths:
-                """ Извлекаем информацию и обновляем прогресс """
-                self._data_extractor.extract_data(path, self._article_data)
-                progress_callback(100 / self._progress_elements)
-
-    def save_data(self, saving_path: str, progress_callback: Callable):
-
-        for strategy in self._saving_strategies:
-            self._data_saver.set_strategy(strategy())
-            self._data_saver.save_data(saving_path, self._article_data)
-            progress_callback(100 / self._progress_elements)
-
-        self._progress_elements = len(self._saving_strategies)
-        self._article_data.clear()
+    def __init__(self):
+        # Состояние у каждого экземпляра свое: после добавления статьи в очередь создается новая модель
+        self._filepaths: dict[FileType, list[str]] = {}
 
     def set_file_paths(self, file_type: FileType, paths: list[str]):
         self._filepaths[file_type] = paths
@@ -52,5 +16,16 @@ class MainViewModel:
     def get_article_path(self) -> str:
         return self._filepaths[FileType.Article][0]
 
+    def has_article(self) -> bool:
+        return bool(self._filepaths.get(FileType.Article))
+
+    def to_job(self, saving_path: str) -> ArticleJob:
+        """ Задание для пакетной обработки выбранных файлов """
+        return ArticleJob(
+            article=self.get_article_path(),
+            reviews=list(self._filepaths.get(FileType.Review, [])),
+            saving_path=saving_path
+        )
+
     def clear_file_paths(self):
-        self._filepaths.clear()
\ No newline at end of file
+        self._filepaths.clear()